@@ -53,9 +53,11 @@ function* walk(dir, ignoreDirs = new Set(['node_modules','.git','dist','build','
 
 function countLines(filePath) {
   try {
-    const buf = fs.readFileSync(filePath, 'utf8');
-    // Count newline occurrences; ensure at least 1 for non-empty
-    const lines = buf.split('\n').length;
+    // Scan raw bytes: 0x0A never occurs inside a multi-byte UTF-8 sequence, so no decode is needed
+    const buf = fs.readFileSync(filePath);
+    // Count newline occurrences without building a line array (same result as split('\n').length)
+    let lines = 1;
+    for (let i = buf.indexOf(0x0a); i !== -1; i = buf.indexOf(0x0a, i + 1)) lines++;
     return lines;
   } catch {
     return 0;
@@ -64,6 +66,9 @@ function countLines(filePath) {
 
 function extOf(p) { return path.extname(p).toLowerCase(); }
 
+const TEST_FILE_RE = /\.test\.(t|j)sx?$/;
+const TEST_DIR_RE = /(^|\/)tests?\//;
+
 function semverTagSort(a,b) {
   // naive vX.Y.Z-ish sort; fallback lexicographically
   const va = (a||'').replace(/^v/,'').split('.').map(n=>parseInt(n,10)||0);
@@ -134,7 +139,7 @@ for (const file of walk(scanRoot)) {
   fileStats.totalFiles++;
   const ext = extOf(file);
   if (fileStats.byExt[ext] !== undefined) fileStats.byExt[ext]++;
-  const isTest = /\.test\.(t|j)sx?$/.test(file) || /(^|\/)tests?\//.test(file);
+  const isTest = TEST_FILE_RE.test(file) || TEST_DIR_RE.test(file);
   if (isTest) fileStats.tests++;
   // LOC (only for source code)
   if (['.ts','.tsx','.js','.jsx'].includes(ext)) {
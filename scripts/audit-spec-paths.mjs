@@ -23,15 +23,17 @@ const LEGACY_PATTERNS = [
   { pattern: /^tests\//, message: 'Missing frontend/ prefix. Use: frontend/tests/ (Delta 0013)' },
 ];
 
+// Delta 0017: Use dual regex patterns for better coverage
+// Compiled once at module load; matchAll() clones them, so the shared lastIndex is never touched
+const CODE_SPAN_REGEX = /`([^`]+\.(ts|tsx|js|jsx|mjs|md|json|yml|yaml))`/g;
+const LINK_REGEX = /\[.*?\]\(([^)]+\.(ts|tsx|js|jsx|mjs|md|json|yml|yaml))\)/g;
+
 // Extract file paths from markdown
 function extractPaths(content) {
-  // Delta 0017: Use dual regex patterns for better coverage
-  const codeSpanRegex = /`([^`]+\.(ts|tsx|js|jsx|mjs|md|json|yml|yaml))`/g;
-  const linkRegex = /\[.*?\]\(([^)]+\.(ts|tsx|js|jsx|mjs|md|json|yml|yaml))\)/g;
-
+  // Literal prechecks skip the regex engine on the (common) lines with no code span or link
   const paths = [
-    ...Array.from(content.matchAll(codeSpanRegex), m => m[1]),
-    ...Array.from(content.matchAll(linkRegex), m => m[1])
+    ...(content.includes('`') ? Array.from(content.matchAll(CODE_SPAN_REGEX), m => m[1]) : []),
+    ...(content.includes('](') ? Array.from(content.matchAll(LINK_REGEX), m => m[1]) : [])
   ];
 
   return [...new Set(paths)];